@@ -8,6 +8,7 @@ export const CONFIG = {
   // Audio settings
   AUDIO: {
     SAMPLE_RATE: 16000,
+    TTS_SAMPLE_RATE: 24000,
     CHANNELS: 1,
     CHUNK_SIZE: 4096,
     FORMAT: "pcm16",
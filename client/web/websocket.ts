@@ -15,6 +15,10 @@ export type WSMessageType =
   | "session_start"
   | "session_end";
 
+export enum BinaryMessageType {
+  RESPONSE_AUDIO = 0x01,
+}
+
 export interface WSMessage {
   type: WSMessageType;
   data?: unknown;
@@ -104,14 +108,6 @@ export class VoiceAgentWebSocket {
           this.callbacks.onResponseText?.(textData.text, textData.is_final);
           break;
 
-        case "response_audio":
-          const audioData = message.data as { audio: string; sample_rate: number };
-          const binary = atob(audioData.audio);
-          const bytes = new Uint8Array(binary.length);
-          for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
-          this.audioPlayer.queueAudio(bytes.buffer, audioData.sample_rate);
-          break;
-
         case "response_audio_end":
           // All audio has been queued
           break;
@@ -130,7 +126,14 @@ export class VoiceAgentWebSocket {
   }
 
   private handleAudioChunk(data: ArrayBuffer): void {
-    this.audioPlayer.queueAudio(data);
+    // First byte is the binary message type, the rest is the payload
+    if (data.byteLength < 2) return;
+    const type = new Uint8Array(data, 0, 1)[0];
+    if (type === BinaryMessageType.RESPONSE_AUDIO) {
+      const audio = data.slice(1);
+      this.callbacks.onResponseAudio?.(audio);
+      this.audioPlayer.queueAudio(audio, CONFIG.AUDIO.TTS_SAMPLE_RATE);
+    }
   }
 
   async startListening(): Promise<void> {
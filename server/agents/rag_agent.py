@@ -58,6 +58,8 @@ class RAGAgent:
 
     async def query(self, question: str, top_k: int = None) -> str:
         """Retrieve context for a question."""
+        if vector_store.count == 0:
+            return ""
         return await retriever.retrieve_formatted(question, top_k)
 
     @property
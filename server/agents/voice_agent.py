@@ -1,8 +1,11 @@
 import logging
 import asyncio
-from typing import AsyncGenerator, Callable, Optional
+import itertools
+from collections import defaultdict
+from typing import AsyncGenerator, Awaitable, Callable, Optional
 
 from server.speech.stt import stt
+from server.speech.streaming_stt import StreamingTranscriber
 from server.speech.tts import tts
 from server.speech.audio_processor import AudioProcessor
 from server.llm.ollama_client import ollama_client
@@ -10,9 +13,13 @@ from server.llm.prompt_builder import PromptBuilder
 from server.agents.rag_agent import rag_agent
 from server.agents.memory_agent import memory_agent
 from server.config.constants import AgentState
+from server.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+SENTENCE_TERMINATORS = frozenset(".!?:;")
+CLAUSE_MIN_WORDS = 4  # flush on a comma once this many words are buffered
+
 
 class VoiceAgent:
     """
@@ -23,37 +30,58 @@ class VoiceAgent:
         self.session_id = session_id
         self.state = AgentState.IDLE
         self._audio_buffer = bytearray()
+        self._stt_stream: Optional[StreamingTranscriber] = None
 
     def append_audio(self, chunk: bytes) -> None:
-        """Accumulate incoming audio bytes."""
+        """Accumulate incoming audio bytes and feed the streaming transcriber."""
         self._audio_buffer.extend(chunk)
+        if settings.STT_STREAMING:
+            if self._stt_stream is None:
+                self._stt_stream = StreamingTranscriber()
+            self._stt_stream.feed(chunk)
 
     def clear_audio_buffer(self) -> None:
         self._audio_buffer = bytearray()
+        if self._stt_stream:
+            self._stt_stream.cancel()
+            self._stt_stream = None
 
     async def process(
         self,
-        on_transcript: Optional[Callable[[str], None]] = None,
-        on_text_chunk: Optional[Callable[[str], None]] = None,
-        on_audio_chunk: Optional[Callable[[bytes], None]] = None,
+        on_transcript: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_text_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_audio_chunk: Optional[Callable[[bytes], Awaitable[None]]] = None,
+        on_text_end: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> dict:
         """
         Process buffered audio end-to-end.
-        Calls callbacks as results are ready for streaming to client.
+        Awaits the async callbacks as results are ready for streaming to client.
         Returns final result dict.
         """
         if not self._audio_buffer:
             return {"error": "No audio data"}
 
-        audio_bytes = bytes(self._audio_buffer)
+        # Hand the buffer over without copying; clear_audio_buffer() rebinds
+        # a fresh bytearray, so nothing else mutates this one.
+        audio_bytes = self._audio_buffer
+        stt_stream, self._stt_stream = self._stt_stream, None
         self.clear_audio_buffer()
 
         # ── 1. Speech to Text ──────────────────────────────────────────────
         self.state = AgentState.TRANSCRIBING
         logger.info(f"[{self.session_id[:8]}] Transcribing {len(audio_bytes)} bytes...")
 
-        stt_result = await stt.transcribe(audio_bytes)
-        transcript = stt_result.get("text", "").strip()
+        transcript = None
+        if stt_stream:
+            # Most of the utterance is already decoded; only the tail remains
+            try:
+                transcript = await stt_stream.finish()
+            except Exception as e:
+                logger.warning(f"Streaming STT failed, falling back to full transcription: {e}")
+
+        if transcript is None:
+            stt_result = await stt.transcribe(audio_bytes)
+            transcript = stt_result.get("text", "").strip()
 
         if not transcript:
             self.state = AgentState.IDLE
@@ -61,7 +89,7 @@ class VoiceAgent:
 
         logger.info(f"[{self.session_id[:8]}] Transcript: {transcript}")
         if on_transcript:
-            on_transcript(transcript)
+            await on_transcript(transcript)
 
         # ── 2. Retrieve Context (RAG + Memory) ────────────────────────────
         self.state = AgentState.THINKING
@@ -83,26 +111,70 @@ class VoiceAgent:
         logger.info(f"[{self.session_id[:8]}] Generating response...")
         response_text = ""
         sentence_buffer = ""
+        sentence_words = 0
+        tts_tasks: list[asyncio.Task] = []
+
+        # TTS runs concurrently per sentence; chunks are tagged with the
+        # sentence sequence number and re-ordered before delivery.
+        sequence = itertools.count()
+        tts_queue: asyncio.Queue[tuple[int, Optional[bytes]] | None] = asyncio.Queue()
+        deliver_task = None
+        if on_audio_chunk:
+            deliver_task = asyncio.create_task(
+                self._deliver_audio_in_order(tts_queue, on_audio_chunk)
+            )
 
-        async for token in await ollama_client.chat(messages, stream=True):
-            response_text += token
-            sentence_buffer += token
-
-            if on_text_chunk:
-                on_text_chunk(token)
-
-            # Stream TTS sentence-by-sentence for low latency
-            if on_audio_chunk and self._is_sentence_boundary(sentence_buffer):
-                sentence = sentence_buffer.strip()
-                sentence_buffer = ""
-                if sentence:
-                    asyncio.create_task(
-                        self._stream_tts(sentence, on_audio_chunk)
-                    )
-
-        # Flush remaining sentence buffer
-        if sentence_buffer.strip() and on_audio_chunk:
-            await self._stream_tts(sentence_buffer.strip(), on_audio_chunk)
+        try:
+            async for token in await ollama_client.chat(messages, stream=True):
+                response_text += token
+                # Count words started by this token (leading space or buffer start)
+                if token[:1].isspace() or not sentence_buffer:
+                    sentence_words += 1
+                sentence_words += token.strip().count(" ")
+                sentence_buffer += token
+
+                if on_text_chunk:
+                    await on_text_chunk(token)
+
+                # Stream TTS sentence-by-sentence for low latency
+                if on_audio_chunk and self._is_sentence_boundary(
+                    token, len(sentence_buffer), sentence_words
+                ):
+                    sentence = sentence_buffer.strip()
+                    sentence_buffer = ""
+                    sentence_words = 0
+                    if sentence:
+                        tts_tasks.append(asyncio.create_task(
+                            self._stream_tts(sentence, next(sequence), tts_queue)
+                        ))
+
+            # Text is complete; let the caller flush anything it is holding
+            # instead of waiting for the remaining audio
+            if on_text_end:
+                await on_text_end()
+
+            # Flush remaining sentence buffer
+            if sentence_buffer.strip() and on_audio_chunk:
+                tts_tasks.append(asyncio.create_task(
+                    self._stream_tts(sentence_buffer.strip(), next(sequence), tts_queue)
+                ))
+
+            # Wait for in-flight TTS so all audio is delivered before returning
+            await asyncio.gather(*tts_tasks)
+            if deliver_task:
+                tts_queue.put_nowait(None)
+                await deliver_task
+        finally:
+            # On an LLM error or cancellation (barge-in) the pipeline above did not
+            # drain: stop in-flight TTS and the delivery task instead of leaking them
+            for task in tts_tasks:
+                task.cancel()
+            if deliver_task and not deliver_task.done():
+                deliver_task.cancel()
+            await asyncio.gather(
+                *tts_tasks, *([deliver_task] if deliver_task else []),
+                return_exceptions=True,
+            )
 
         # ── 5. Store to Memory ────────────────────────────────────────────
         await memory_agent.record_exchange(self.session_id, transcript, response_text)
@@ -114,20 +186,60 @@ class VoiceAgent:
             "rag_context_used": bool(rag_context),
         }
 
-    async def _stream_tts(self, text: str, callback: Callable[[bytes], None]) -> None:
-        """Synthesize and stream TTS audio."""
+    async def _stream_tts(
+        self,
+        text: str,
+        seq: int,
+        queue: asyncio.Queue,
+    ) -> None:
+        """Synthesize TTS audio, pushing (seq, chunk) pairs and a final (seq, None)."""
         self.state = AgentState.SPEAKING
         try:
             async for chunk in tts.synthesize_streaming(text):
                 if chunk:
-                    callback(chunk)
+                    queue.put_nowait((seq, chunk))
         except Exception as e:
             logger.error(f"TTS error: {e}")
+        finally:
+            queue.put_nowait((seq, None))
 
     @staticmethod
-    def _is_sentence_boundary(text: str) -> bool:
-        """Detect if text ends with a sentence boundary."""
-        stripped = text.strip()
-        if not stripped:
+    async def _deliver_audio_in_order(
+        queue: asyncio.Queue,
+        callback: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """
+        Reorder buffer for concurrent TTS: forward chunks strictly in
+        sentence order, holding back later sentences until earlier ones end.
+        """
+        next_seq = 0
+        pending: dict[int, list[Optional[bytes]]] = defaultdict(list)
+
+        while (item := await queue.get()) is not None:
+            seq, chunk = item
+            pending[seq].append(chunk)
+
+            while next_seq in pending:
+                chunks = pending.pop(next_seq)
+                for c in chunks:
+                    if c is not None:
+                        await callback(c)
+                # None marks the end of a sentence and is always pushed last
+                if chunks[-1] is not None:
+                    break
+                next_seq += 1
+
+    @staticmethod
+    def _is_sentence_boundary(token: str, buffer_len: int, word_count: int) -> bool:
+        """
+        Detect if the newly appended token ends a sentence (or a clause long
+        enough to start TTS early). Only the token is inspected, so the
+        check is O(1) in the size of the buffered sentence.
+        """
+        tail = token.rstrip()
+        if not tail:
             return False
-        return stripped[-1] in ".!?:;" and len(stripped) > 10
+        last = tail[-1]
+        if last in SENTENCE_TERMINATORS:
+            return buffer_len > 10
+        return last == "," and word_count >= CLAUSE_MIN_WORDS
@@ -13,6 +13,8 @@ START_TIME = time.time()
 
 @router.get("/health")
 async def health_check():
+    # Both calls are served by OllamaClient's cached /api/tags poll, so
+    # frequent liveness/readiness probes do not each hit Ollama
     ollama_ok = await ollama_client.health_check()
     models = await ollama_client.list_models() if ollama_ok else []
 
@@ -1,8 +1,9 @@
-import json
 import logging
-import uuid
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
+from server.api.websocket_handler import send_json
+
 logger = logging.getLogger(__name__)
 
 # Map session_id → WebSocket
@@ -21,7 +22,7 @@ async def webrtc_handler(websocket: WebSocket, session_id: str):
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             msg_type = message.get("type")
 
             if msg_type == "offer":
@@ -30,13 +31,13 @@ async def webrtc_handler(websocket: WebSocket, session_id: str):
                 # the actual WebRTC peer connection on the server side.
                 # For now we echo back an answer placeholder.
                 logger.info(f"Received WebRTC offer from {session_id[:8]}")
-                await websocket.send_text(json.dumps({
+                await send_json(websocket, {
                     "type": "answer",
                     "sdp": {
                         "type": "answer",
                         "sdp": _generate_placeholder_answer(message.get("sdp", {})),
                     }
-                }))
+                })
 
             elif msg_type == "ice_candidate":
                 logger.debug(f"ICE candidate from {session_id[:8]}")
@@ -1,15 +1,21 @@
-import json
-import base64
 import asyncio
 import logging
-import uuid
+import secrets
+import time
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from server.agents.voice_agent import VoiceAgent
-from server.config.constants import MessageType
+from server.agents.voice_agent import VoiceAgent, SENTENCE_TERMINATORS
+from server.config.constants import MessageType, BinaryMessageType
 
 logger = logging.getLogger(__name__)
 
+# Binary audio frame: 1 type byte followed by the raw TTS payload
+AUDIO_FRAME_PREFIX = bytes([BinaryMessageType.RESPONSE_AUDIO])
+
+# Streamed LLM tokens are coalesced into one frame per sentence or per interval
+TEXT_FLUSH_INTERVAL = 0.016  # seconds
+
 
 class ConnectionManager:
     def __init__(self):
@@ -30,7 +36,7 @@ manager = ConnectionManager()
 
 
 async def websocket_handler(websocket: WebSocket):
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_urlsafe(12)
     await websocket.accept()
     manager.add(session_id, websocket)
 
@@ -68,13 +74,14 @@ async def websocket_handler(websocket: WebSocket):
         except Exception:
             pass
     finally:
+        agent.clear_audio_buffer()
         manager.remove(session_id)
 
 
 async def handle_text_message(websocket: WebSocket, agent: VoiceAgent, raw: str):
     try:
-        message = json.loads(raw)
-    except json.JSONDecodeError:
+        message = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return
 
     msg_type = message.get("type")
@@ -100,45 +107,77 @@ async def process_audio(websocket: WebSocket, agent: VoiceAgent):
         })
 
     text_buffer = []
+    pending_text: list[str] = []
+    last_flush = time.monotonic()
+    flush_timer: asyncio.TimerHandle | None = None
+    timer_flushes: set[asyncio.Task] = set()
+
+    async def flush_text():
+        nonlocal last_flush, flush_timer
+        last_flush = time.monotonic()
+        if flush_timer:
+            flush_timer.cancel()
+            flush_timer = None
+        if pending_text:
+            text = "".join(pending_text)
+            pending_text.clear()
+            await send_json(websocket, {
+                "type": MessageType.RESPONSE_TEXT,
+                "data": {"text": text, "is_final": False},
+            })
 
     async def on_text_chunk(token: str):
+        nonlocal flush_timer
         text_buffer.append(token)
-        await send_json(websocket, {
-            "type": MessageType.RESPONSE_TEXT,
-            "data": {"text": token, "is_final": False},
-        })
+        pending_text.append(token)
+        tail = token.rstrip()
+        if (tail and tail[-1] in SENTENCE_TERMINATORS) or (
+            time.monotonic() - last_flush >= TEXT_FLUSH_INTERVAL
+        ):
+            await flush_text()
+        elif flush_timer is None:
+            # Don't hold a coalesced token until the next one arrives
+            flush_timer = asyncio.get_running_loop().call_later(
+                TEXT_FLUSH_INTERVAL, schedule_flush
+            )
+
+    def schedule_flush():
+        nonlocal flush_timer
+        flush_timer = None
+        task = asyncio.create_task(flush_text())
+        timer_flushes.add(task)
+        task.add_done_callback(timer_flushes.discard)
 
     audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
 
-    async def on_audio_chunk(chunk: bytes):
-        await audio_queue.put(chunk)
+    async def run_agent() -> dict:
+        try:
+            return await agent.process(
+                on_transcript=on_transcript,
+                on_text_chunk=on_text_chunk,
+                on_audio_chunk=audio_queue.put,
+                on_text_end=flush_text,
+            )
+        finally:
+            # Sentinel: no more audio will follow
+            audio_queue.put_nowait(None)
 
     # Run agent processing in background
-    process_task = asyncio.create_task(
-        agent.process(
-            on_transcript=lambda t: asyncio.create_task(_safe_send_transcript(websocket, t)),
-            on_text_chunk=lambda t: asyncio.create_task(_safe_send_text(websocket, t)),
-            on_audio_chunk=lambda c: asyncio.create_task(audio_queue.put(c)),
-        )
-    )
-
-    # Stream audio chunks to client as they arrive
-    while True:
-        try:
-            chunk = await asyncio.wait_for(audio_queue.get(), timeout=0.1)
-            if chunk is None:
-                break
-            # Send as base64 JSON (could also send binary with websocket.send_bytes)
-            encoded = base64.b64encode(chunk).decode("utf-8")
-            await send_json(websocket, {
-                "type": MessageType.RESPONSE_AUDIO,
-                "data": {"audio": encoded, "sample_rate": 24000},
-            })
-        except asyncio.TimeoutError:
-            if process_task.done():
-                break
+    process_task = asyncio.create_task(run_agent())
 
-    await process_task
+    # Stream audio chunks to client as they arrive. Send errors propagate
+    # to websocket_handler; make sure the agent task does not outlive them.
+    try:
+        while (chunk := await audio_queue.get()) is not None:
+            await websocket.send_bytes(AUDIO_FRAME_PREFIX + chunk)
+
+        await process_task
+        await flush_text()
+    finally:
+        if flush_timer:
+            flush_timer.cancel()
+        if not process_task.done():
+            process_task.cancel()
 
     # Signal audio stream end
     await send_json(websocket, {"type": MessageType.RESPONSE_AUDIO_END})
@@ -151,25 +190,6 @@ async def process_audio(websocket: WebSocket, agent: VoiceAgent):
         })
 
 
-async def _safe_send_transcript(websocket: WebSocket, text: str):
-    try:
-        await send_json(websocket, {
-            "type": MessageType.TRANSCRIPT,
-            "data": {"text": text, "is_final": True},
-        })
-    except Exception:
-        pass
-
-
-async def _safe_send_text(websocket: WebSocket, token: str):
-    try:
-        await send_json(websocket, {
-            "type": MessageType.RESPONSE_TEXT,
-            "data": {"text": token, "is_final": False},
-        })
-    except Exception:
-        pass
-
-
 async def send_json(websocket: WebSocket, data: dict):
-    await websocket.send_text(json.dumps(data))
+    # Called once per streamed LLM token, hence orjson
+    await websocket.send_text(orjson.dumps(data).decode())
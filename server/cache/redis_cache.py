@@ -1,8 +1,9 @@
 import json
-import hashlib
 import logging
-from typing import Optional, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Any
 import redis.asyncio as aioredis
+import xxhash
 
 from server.config.settings import settings
 
@@ -15,11 +16,13 @@ class RedisCache:
 
     async def connect(self) -> None:
         try:
-            self._client = aioredis.from_url(
+            pool = aioredis.ConnectionPool.from_url(
                 settings.REDIS_URL,
-                encoding="utf-8",
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
                 decode_responses=False,
             )
+            # from_pool hands pool ownership to the client (closed on aclose)
+            self._client = aioredis.Redis.from_pool(pool)
             await self._client.ping()
             logger.info("Redis connected successfully")
         except Exception as e:
@@ -33,6 +36,18 @@ class RedisCache:
     def _key(self, namespace: str, key: str) -> str:
         return f"voice-agent:{namespace}:{key}"
 
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[Optional[aioredis.client.Pipeline]]:
+        """
+        Non-transactional pipeline for batching commands into one round-trip.
+        Yields None when Redis is unavailable.
+        """
+        if not self._client:
+            yield None
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            yield pipe
+
     async def get(self, namespace: str, key: str) -> Optional[Any]:
         if not self._client:
             return None
@@ -86,9 +101,88 @@ class RedisCache:
             logger.error(f"Cache set_bytes error: {e}")
             return False
 
+    async def mget(self, namespace: str, keys: list[str]) -> list[Optional[bytes]]:
+        """Fetch several raw values in a single round-trip."""
+        if not self._client or not keys:
+            return [None] * len(keys)
+        try:
+            return await self._client.mget([self._key(namespace, k) for k in keys])
+        except Exception as e:
+            logger.error(f"Cache mget error: {e}")
+        return [None] * len(keys)
+
+    async def mset_ex(self, namespace: str, items: list[tuple[str, bytes]], ttl: int = None) -> bool:
+        """Store several raw values with a TTL using one pipelined round-trip."""
+        if not self._client or not items:
+            return False
+        try:
+            ttl = ttl or settings.REDIS_TTL
+            async with self.pipeline() as pipe:
+                for key, value in items:
+                    pipe.setex(self._key(namespace, key), ttl, value)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache mset_ex error: {e}")
+            return False
+
+    async def list_append(
+        self,
+        namespace: str,
+        key: str,
+        values: list[Any],
+        max_len: int = None,
+        ttl: int = None,
+    ) -> bool:
+        """RPUSH values, cap the list length and refresh its TTL in one round-trip."""
+        if not self._client or not values:
+            return False
+        try:
+            ttl = ttl or settings.REDIS_TTL
+            full_key = self._key(namespace, key)
+            async with self.pipeline() as pipe:
+                pipe.rpush(full_key, *[json.dumps(v) for v in values])
+                if max_len:
+                    pipe.ltrim(full_key, -max_len, -1)
+                pipe.expire(full_key, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache list_append error: {e}")
+            return False
+
+    async def list_replace(self, namespace: str, key: str, values: list[Any], ttl: int = None) -> bool:
+        """Replace the whole list in one round-trip."""
+        if not self._client:
+            return False
+        try:
+            ttl = ttl or settings.REDIS_TTL
+            full_key = self._key(namespace, key)
+            async with self.pipeline() as pipe:
+                pipe.delete(full_key)
+                if values:
+                    pipe.rpush(full_key, *[json.dumps(v) for v in values])
+                    pipe.expire(full_key, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache list_replace error: {e}")
+            return False
+
+    async def list_get(self, namespace: str, key: str) -> list[Any]:
+        if not self._client:
+            return []
+        try:
+            data = await self._client.lrange(self._key(namespace, key), 0, -1)
+            return [json.loads(v) for v in data]
+        except Exception as e:
+            logger.error(f"Cache list_get error: {e}")
+        return []
+
     @staticmethod
     def hash_key(text: str) -> str:
-        return hashlib.sha256(text.encode()).hexdigest()[:16]
+        # Non-cryptographic: cache keys only need to be well distributed
+        return xxhash.xxh3_128_hexdigest(text.encode())[:16]
 
     @property
     def available(self) -> bool:
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class MessageType(str, Enum):
@@ -15,6 +15,11 @@ class MessageType(str, Enum):
     SESSION_END = "session_end"
 
 
+class BinaryMessageType(IntEnum):
+    """Leading type byte of binary WebSocket frames sent to the client."""
+    RESPONSE_AUDIO = 0x01
+
+
 class AgentState(str, Enum):
     IDLE = "idle"
     LISTENING = "listening"
@@ -17,12 +17,23 @@ class Settings(BaseSettings):
     OLLAMA_TEMPERATURE: float = 0.7
     OLLAMA_MAX_TOKENS: int = 1024
     OLLAMA_TIMEOUT: int = 120
+    OLLAMA_KEEP_ALIVE: str = "30m"  # keep model + prompt KV cache resident between turns
+    OLLAMA_TAGS_CACHE_SECONDS: int = 30  # health probes reuse the last /api/tags result this long
 
     # STT (Whisper)
+    STT_BACKEND: str = "faster_whisper"  # "faster_whisper" (CTranslate2) or "onnxruntime"
     WHISPER_MODEL: str = "base.en"
     WHISPER_DEVICE: str = "cpu"  # "cpu" or "cuda"
-    WHISPER_COMPUTE_TYPE: str = "int8"  # "int8", "float16", "float32"
+    WHISPER_COMPUTE_TYPE: str = "int8"  # "int8", "int8_float16", "float16", "float32"
+    WHISPER_CPU_THREADS: int = 0  # threads per worker; 0 = available CPUs / WHISPER_NUM_WORKERS
+    WHISPER_NUMA_NODE: int = -1  # pin the process to this NUMA node's CPUs; -1 disables
+    WHISPER_NUM_WORKERS: int = 1
     WHISPER_LANGUAGE: str = "en"
+    WHISPER_ONNX_MODEL: str = "openai/whisper-base.en"  # exported ONNX dir/repo for the onnxruntime backend
+    STT_STREAMING: bool = False  # transcribe incrementally while audio arrives
+    STT_STREAM_INTERVAL_SECONDS: float = 1.0  # new audio between streaming passes
+    STT_STREAM_MAX_WINDOW_SECONDS: float = 15.0  # uncommitted audio re-decoded per pass, at most
+    STT_SILENCE_RMS: float = 0.003  # skip Whisper below this RMS (~-50 dBFS); 0 disables
 
     # TTS (edge-tts)
     TTS_VOICE: str = "en-US-AriaNeural"
@@ -37,14 +48,20 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://redis:6379"
     REDIS_TTL: int = 3600  # 1 hour cache TTL
+    REDIS_MAX_CONNECTIONS: int = 32  # pool size shared by all sessions
 
     # RAG / FAISS
     FAISS_INDEX_PATH: str = "/app/data/faiss_index"
     DOCUMENTS_PATH: str = "/app/data/documents"
     EMBEDDING_DIM: int = 768
+    RAG_INDEX_TYPE: str = "flat"  # "flat" (exact), "hnsw" (sub-linear) or "sq8" (int8 vectors)
+    RAG_HNSW_M: int = 32  # HNSW graph neighbours per node
+    FAISS_SAVE_INTERVAL: int = 30  # seconds between index flushes to disk
     RETRIEVAL_TOP_K: int = 4
     CHUNK_SIZE: int = 512
     CHUNK_OVERLAP: int = 64
+    INGEST_CONCURRENCY: int = 8  # documents embedded in parallel
+    EMBEDDING_BATCH_SIZE: int = 64  # texts per Ollama /api/embed request
 
     # Memory
     MAX_CONVERSATION_TURNS: int = 20
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import numpy as np
 from typing import Optional
@@ -7,6 +8,10 @@ from server.cache.redis_cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Embeddings are cached as raw float32 bytes (4 bytes/dim instead of JSON text)
+CACHE_NAMESPACE = "embeddings_f32"
+CACHE_TTL = 604800  # 7 days
+
 
 class EmbeddingClient:
     """
@@ -16,14 +21,16 @@ class EmbeddingClient:
 
     def __init__(self):
         self._fallback_model = None
+        # Bound concurrent bulk requests to Ollama
+        self._semaphore = asyncio.Semaphore(settings.INGEST_CONCURRENCY)
 
     async def embed(self, text: str) -> np.ndarray:
         """Get embedding for a single text."""
         # Check cache
         cache_key = cache.hash_key(text)
-        cached = await cache.get("embeddings", cache_key)
+        cached = await cache.get_bytes(CACHE_NAMESPACE, cache_key)
         if cached:
-            return np.array(cached, dtype=np.float32)
+            return np.frombuffer(cached, dtype=np.float32).copy()
 
         vector = await self._embed_with_ollama(text)
 
@@ -36,18 +43,67 @@ class EmbeddingClient:
             vector = vector / norm
 
         # Cache embedding for 7 days
-        await cache.set("embeddings", cache_key, vector.tolist(), ttl=604800)
+        await cache.set_bytes(CACHE_NAMESPACE, cache_key, vector.astype(np.float32).tobytes(), ttl=CACHE_TTL)
 
         return vector
 
     async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
         """Embed a list of texts."""
-        results = []
-        for text in texts:
-            emb = await self.embed(text)
-            results.append(emb)
+        return await self.embed_batch_bulk(texts)
+
+    async def embed_batch_bulk(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        Embed a list of texts, sending all cache misses to Ollama
+        in a single request instead of one round-trip per text.
+        """
+        if not texts:
+            return []
+
+        # One MGET for every key instead of a GET per text
+        cache_keys = [cache.hash_key(text) for text in texts]
+        results: list[Optional[np.ndarray]] = [None] * len(texts)
+        for i, cached in enumerate(await cache.mget(CACHE_NAMESPACE, cache_keys)):
+            if cached:
+                results[i] = np.frombuffer(cached, dtype=np.float32).copy()
+
+        misses = [i for i, r in enumerate(results) if r is None]
+        if not misses:
+            return results
+
+        # Large inputs are split into EMBEDDING_BATCH_SIZE requests
+        miss_texts = [texts[i] for i in misses]
+        size = settings.EMBEDDING_BATCH_SIZE
+        groups = await asyncio.gather(*(
+            self._embed_group(miss_texts[j:j + size])
+            for j in range(0, len(miss_texts), size)
+        ))
+        if any(group is None for group in groups):
+            # Ollama and the fallback model differ in dimension, so a partly
+            # failed batch is re-embedded entirely with the fallback model
+            vectors = self._embed_many_with_sentence_transformers(miss_texts)
+        else:
+            vectors = np.concatenate(groups)
+
+        # Normalize all rows in one pass
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = (vectors / np.where(norms > 0, norms, 1.0)).astype(np.float32)
+
+        for i, vector in zip(misses, vectors):
+            results[i] = vector
+
+        # Cache embeddings for 7 days in one pipelined write
+        await cache.mset_ex(
+            CACHE_NAMESPACE,
+            [(cache_keys[i], results[i].tobytes()) for i in misses],
+            ttl=CACHE_TTL,
+        )
+
         return results
 
+    async def _embed_group(self, texts: list[str]) -> Optional[np.ndarray]:
+        async with self._semaphore:
+            return await self._embed_many_with_ollama(texts)
+
     async def _embed_with_ollama(self, text: str) -> Optional[np.ndarray]:
         try:
             from server.llm.ollama_client import ollama_client
@@ -57,7 +113,16 @@ class EmbeddingClient:
             logger.warning(f"Ollama embedding failed: {e}. Falling back to sentence-transformers.")
             return None
 
-    def _embed_with_sentence_transformers(self, text: str) -> np.ndarray:
+    async def _embed_many_with_ollama(self, texts: list[str]) -> Optional[np.ndarray]:
+        try:
+            from server.llm.ollama_client import ollama_client
+            vectors = await ollama_client.embed_batch(texts)
+            return np.array(vectors, dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Ollama batch embedding failed: {e}. Falling back to sentence-transformers.")
+            return None
+
+    def _load_fallback_model(self) -> bool:
         if self._fallback_model is None:
             try:
                 from sentence_transformers import SentenceTransformer
@@ -65,12 +130,25 @@ class EmbeddingClient:
                 logger.info("Loaded sentence-transformers fallback model")
             except ImportError:
                 logger.error("sentence-transformers not installed. Run: pip install sentence-transformers")
-                # Return random vector as last resort
-                return np.random.randn(settings.EMBEDDING_DIM).astype(np.float32)
+                return False
+        return True
+
+    def _embed_with_sentence_transformers(self, text: str) -> np.ndarray:
+        if not self._load_fallback_model():
+            # Return random vector as last resort
+            return np.random.randn(settings.EMBEDDING_DIM).astype(np.float32)
 
         vector = self._fallback_model.encode(text, normalize_embeddings=True)
         return vector.astype(np.float32)
 
+    def _embed_many_with_sentence_transformers(self, texts: list[str]) -> np.ndarray:
+        if not self._load_fallback_model():
+            # Return random vectors as last resort
+            return np.random.randn(len(texts), settings.EMBEDDING_DIM).astype(np.float32)
+
+        vectors = self._fallback_model.encode(texts, normalize_embeddings=True)
+        return vectors.astype(np.float32)
+
 
 # Singleton
 embedding_client = EmbeddingClient()
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import re
+from itertools import chain
 from typing import Optional
 import numpy as np
 
@@ -7,6 +10,8 @@ from server.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\S+")
+
 
 class EmbeddingPipeline:
     """Pipeline for embedding documents in batches with chunking."""
@@ -16,14 +21,23 @@ class EmbeddingPipeline:
         self.chunk_overlap = chunk_overlap or settings.CHUNK_OVERLAP
 
     def chunk_text(self, text: str) -> list[str]:
-        """Split text into overlapping chunks."""
-        words = text.split()
+        """
+        Split text into overlapping chunks of ``chunk_size`` words.
+        Chunks are sliced from the original text by word offsets rather
+        than re-joined from a word list.
+        """
+        spans = [m.span() for m in _WORD_RE.finditer(text)]
+        if not spans:
+            return []
+        if len(spans) <= self.chunk_size:
+            return [text[spans[0][0]:spans[-1][1]]]
+
         chunks = []
         i = 0
-        while i < len(words):
-            chunk_words = words[i:i + self.chunk_size]
-            chunks.append(" ".join(chunk_words))
-            if i + self.chunk_size >= len(words):
+        while i < len(spans):
+            end = min(i + self.chunk_size, len(spans))
+            chunks.append(text[spans[i][0]:spans[end - 1][1]])
+            if end >= len(spans):
                 break
             i += self.chunk_size - self.chunk_overlap
         return chunks
@@ -38,12 +52,13 @@ class EmbeddingPipeline:
         Returns list of {"content", "embedding", "metadata"} dicts.
         """
         chunks = self.chunk_text(text)
-        results = []
+        nonempty = [(i, chunk) for i, chunk in enumerate(chunks) if chunk.strip()]
 
-        for i, chunk in enumerate(chunks):
-            if not chunk.strip():
-                continue
-            embedding = await embedding_client.embed(chunk)
+        # Embed all chunks in one round-trip
+        embeddings = await embedding_client.embed_batch_bulk([c for _, c in nonempty])
+
+        results = []
+        for (i, chunk), embedding in zip(nonempty, embeddings):
             results.append({
                 "content": chunk,
                 "embedding": embedding,
@@ -62,14 +77,18 @@ class EmbeddingPipeline:
         Process multiple documents.
         Each document should have 'content' and optionally 'metadata'.
         """
-        all_chunks = []
-        for doc in documents:
-            chunks = await self.process_document(
-                doc["content"],
-                metadata=doc.get("metadata", {}),
-            )
-            all_chunks.extend(chunks)
-        return all_chunks
+        semaphore = asyncio.Semaphore(settings.INGEST_CONCURRENCY)
+
+        async def process_one(doc: dict) -> list[dict]:
+            async with semaphore:
+                return await self.process_document(
+                    doc["content"],
+                    metadata=doc.get("metadata", {}),
+                )
+
+        # Documents are embedded concurrently; gather keeps their order
+        results = await asyncio.gather(*(process_one(doc) for doc in documents))
+        return list(chain.from_iterable(results))
 
 
 embedding_pipeline = EmbeddingPipeline()
@@ -1,10 +1,28 @@
+import asyncio
 import logging
+import time
 import httpx
 import json
 from typing import AsyncGenerator, Optional
 
 from server.config.settings import settings
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # fall back to stdlib json
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Request bodies are pre-encoded, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tokens buffered between the stream reader and a slow consumer
+STREAM_QUEUE_SIZE = 32
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +31,32 @@ class OllamaClient:
         self.base_url = settings.OLLAMA_BASE_URL
         self.model = settings.OLLAMA_MODEL
         self.timeout = settings.OLLAMA_TIMEOUT
+        self._client: Optional[httpx.AsyncClient] = None
+        # (checked_at, model names); None when Ollama was unreachable
+        self._tags_cache: tuple[float, Optional[list[str]]] = (0.0, None)
+
+    async def startup(self) -> None:
+        """Create the shared, keep-alive HTTP client."""
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Lazily created if startup() was not called (e.g. outside the app lifespan)
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
 
     async def chat(
         self,
@@ -29,6 +73,8 @@ class OllamaClient:
             "model": self.model,
             "messages": messages,
             "stream": stream,
+            # Keep the runner (and its cached prompt prefix) warm between turns
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
             "options": {
                 "temperature": temperature or settings.OLLAMA_TEMPERATURE,
                 "num_predict": max_tokens or settings.OLLAMA_MAX_TOKENS,
@@ -41,63 +87,107 @@ class OllamaClient:
             return await self._complete_chat(payload)
 
     async def _complete_chat(self, payload: dict) -> str:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["message"]["content"]
+        response = await self.client.post(
+            f"{self.base_url}/api/chat",
+            content=_dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
+        return data["message"]["content"]
 
     async def _stream_chat(self, payload: dict) -> AsyncGenerator[str, None]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream("POST", f"{self.base_url}/api/chat", json=payload) as response:
+        # A background reader keeps draining the socket while the consumer is busy
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        reader = asyncio.create_task(self._read_stream(payload, queue))
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            reader.cancel()
+
+    async def _read_stream(self, payload: dict, queue: asyncio.Queue) -> None:
+        """Parse streamed chat lines into tokens; ends with None or the error."""
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                content=_dumps(payload),
+                headers=_JSON_HEADERS,
+            ) as response:
                 response.raise_for_status()
                 async for line in response.aiter_lines():
                     if line:
                         try:
-                            data = json.loads(line)
+                            data = _loads(line)
                             if not data.get("done", False):
                                 content = data.get("message", {}).get("content", "")
                                 if content:
-                                    yield content
-                        except json.JSONDecodeError:
+                                    await queue.put(content)
+                        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
                             pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
 
     async def embed(self, text: str) -> list[float]:
         """Get embeddings from Ollama."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/embed",
-                json={
-                    "model": settings.OLLAMA_EMBEDDING_MODEL,
-                    "input": text,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["embeddings"][0]
+        response = await self.client.post(
+            f"{self.base_url}/api/embed",
+            content=_dumps({
+                "model": settings.OLLAMA_EMBEDDING_MODEL,
+                "input": text,
+            }),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
+        return data["embeddings"][0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for several texts in a single Ollama request."""
+        response = await self.client.post(
+            f"{self.base_url}/api/embed",
+            content=_dumps({
+                "model": settings.OLLAMA_EMBEDDING_MODEL,
+                "input": texts,
+            }),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
+        return data["embeddings"]
 
     async def health_check(self) -> bool:
         """Check if Ollama is running."""
-        try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
-        except Exception:
-            return False
+        return await self._tags() is not None
 
     async def list_models(self) -> list[str]:
         """List available models."""
+        return await self._tags() or []
+
+    async def _tags(self) -> Optional[list[str]]:
+        """Poll /api/tags, reusing the last result for OLLAMA_TAGS_CACHE_SECONDS."""
+        checked_at, models = self._tags_cache
+        if time.monotonic() - checked_at < settings.OLLAMA_TAGS_CACHE_SECONDS:
+            return models
+
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
+            response = await self.client.get(f"{self.base_url}/api/tags", timeout=5)
+            response.raise_for_status()
+            data = _loads(response.content)
+            models = [m["name"] for m in data.get("models", [])]
         except Exception as e:
-            logger.error(f"Could not list models: {e}")
-            return []
+            logger.error(f"Could not reach Ollama: {e}")
+            models = None
+
+        self._tags_cache = (time.monotonic(), models)
+        return models
 
 
 # Singleton
@@ -30,16 +30,12 @@ class PromptBuilder:
         system_prompt: str,
     ) -> list[dict]:
         """Build the messages list for the LLM API."""
-        messages = [{"role": "system", "content": system_prompt}]
-
-        # Add conversation history (trim to last N turns)
-        for turn in conversation_history[-20:]:
-            messages.append(turn)
-
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
-
-        return messages
+        # System prompt, the last N history turns, then the current user message
+        return [
+            {"role": "system", "content": system_prompt},
+            *conversation_history[-20:],
+            {"role": "user", "content": user_message},
+        ]
 
     @staticmethod
     def build_memory_summary_prompt(conversation: str) -> list[dict]:
@@ -57,11 +53,8 @@ class PromptBuilder:
         if not documents:
             return ""
 
-        parts = []
-        for i, doc in enumerate(documents, 1):
-            source = doc.get("source", f"Document {i}")
-            content = doc.get("content", "")
-            score = doc.get("score", 0)
-            parts.append(f"[{source}] (relevance: {score:.2f})\n{content}")
-
-        return "\n\n".join(parts)
+        return "\n\n".join(
+            f"[{doc.get('source', f'Document {i}')}] "
+            f"(relevance: {doc.get('score', 0):.2f})\n{doc.get('content', '')}"
+            for i, doc in enumerate(documents, 1)
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uvicorn
 from contextlib import asynccontextmanager
@@ -13,8 +14,10 @@ from server.api.health_check import router as health_router
 from server.api.websocket_handler import websocket_handler
 from server.api.webrtc_handler import webrtc_handler
 from server.cache.redis_cache import cache
+from server.llm.ollama_client import ollama_client
 from server.speech.stt import stt
 from server.agents.rag_agent import rag_agent
+from server.rag.vector_store import vector_store
 
 logging.basicConfig(
     level=logging.DEBUG if settings.DEBUG else logging.INFO,
@@ -31,9 +34,12 @@ async def lifespan(app: FastAPI):
     # Connect to Redis (non-fatal)
     await cache.connect()
 
-    # Load Whisper model
+    # Shared keep-alive HTTP client for Ollama
+    await ollama_client.startup()
+
+    # Load Whisper model and warm its kernels before the first request
     try:
-        stt.load()
+        await stt.warmup()
     except Exception as e:
         logger.warning(f"STT model could not be loaded: {e}")
 
@@ -44,10 +50,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"RAG initialization failed: {e}")
 
+    # Persist index changes in the background instead of on every add
+    autosave_task = asyncio.create_task(
+        vector_store.autosave(settings.FAISS_SAVE_INTERVAL)
+    )
+
     logger.info("Server ready ✓")
     yield
 
     # Shutdown
+    autosave_task.cancel()
+    try:
+        vector_store.flush()
+    except Exception as e:
+        logger.error(f"Failed to save vector store: {e}")
+    await ollama_client.aclose()
     await cache.disconnect()
     logger.info("Server shutdown complete")
 
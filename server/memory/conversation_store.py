@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
 import time
 
@@ -9,12 +9,22 @@ from server.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     role: str  # "user" or "assistant"
     content: str
     timestamp: float = field(default_factory=time.time)
 
+    def to_row(self) -> tuple[str, str, float]:
+        """Compact [role, content, timestamp] form stored in Redis."""
+        return (self.role, self.content, self.timestamp)
+
+    @classmethod
+    def from_row(cls, row: list | dict) -> "ConversationTurn":
+        if isinstance(row, dict):  # older dict-shaped entries
+            return cls(**row)
+        return cls(*row)
+
 
 @dataclass
 class ConversationSession:
@@ -25,49 +35,64 @@ class ConversationSession:
     updated_at: float = field(default_factory=time.time)
 
 
+SESSION_TTL = 86400  # 24h
+
+
 class ConversationStore:
-    """Stores conversation history per session with Redis persistence."""
+    """
+    Stores conversation history per session with Redis persistence.
+
+    The in-memory session is authoritative while fresh; Redis keeps turns as
+    a list (one RPUSH per new turn) plus a small meta record, so a write
+    costs O(1) in the length of the history.
+    """
 
     def __init__(self):
-        # In-memory fallback
+        # In-memory copy of active sessions
         self._sessions: dict[str, ConversationSession] = {}
 
     async def get_session(self, session_id: str) -> ConversationSession:
         """Get or create a session."""
-        # Try Redis first
-        data = await cache.get("sessions", session_id)
-        if data:
-            session = ConversationSession(
-                session_id=data["session_id"],
-                turns=[ConversationTurn(**t) for t in data["turns"]],
-                summary=data.get("summary", ""),
-                created_at=data.get("created_at", time.time()),
-                updated_at=data.get("updated_at", time.time()),
-            )
-            self._sessions[session_id] = session
+        session = self._sessions.get(session_id)
+        if session and time.time() - session.updated_at < SESSION_TTL:
             return session
 
-        # Check in-memory
-        if session_id in self._sessions:
-            return self._sessions[session_id]
+        # Not in memory (or stale): load from Redis
+        meta = await cache.get("sessions", f"{session_id}:meta")
+        if meta:
+            turns = await cache.list_get("sessions", f"{session_id}:turns")
+            session = ConversationSession(
+                session_id=session_id,
+                turns=[ConversationTurn.from_row(t) for t in turns],
+                summary=meta.get("summary", ""),
+                created_at=meta.get("created_at", time.time()),
+                updated_at=meta.get("updated_at", time.time()),
+            )
+        else:
+            # Create new session
+            session = ConversationSession(session_id=session_id)
 
-        # Create new session
-        session = ConversationSession(session_id=session_id)
         self._sessions[session_id] = session
         return session
 
     async def add_turn(self, session_id: str, role: str, content: str) -> None:
         """Add a conversation turn."""
         session = await self.get_session(session_id)
-        session.turns.append(ConversationTurn(role=role, content=content))
+        turn = ConversationTurn(role=role, content=content)
+        session.turns.append(turn)
         session.updated_at = time.time()
 
         # Trim old turns beyond max
-        if len(session.turns) > settings.MAX_CONVERSATION_TURNS * 2:
+        max_turns = settings.MAX_CONVERSATION_TURNS * 2
+        if len(session.turns) > max_turns:
             # Keep summary of old turns, drop them
-            session.turns = session.turns[-settings.MAX_CONVERSATION_TURNS * 2:]
+            session.turns = session.turns[-max_turns:]
 
-        await self._persist(session)
+        await cache.list_append(
+            "sessions", f"{session_id}:turns", [turn.to_row()],
+            max_len=max_turns, ttl=SESSION_TTL,
+        )
+        await self._persist_meta(session)
 
     async def get_history(self, session_id: str) -> list[dict]:
         """Get conversation history as list of {role, content} dicts."""
@@ -79,6 +104,11 @@ class ConversationStore:
         session = await self.get_session(session_id)
         return session.summary
 
+    async def get_session_bundle(self, session_id: str) -> tuple[str, list[dict]]:
+        """Get (summary, history) from a single session fetch."""
+        session = await self.get_session(session_id)
+        return session.summary, [{"role": t.role, "content": t.content} for t in session.turns]
+
     async def set_summary(self, session_id: str, summary: str) -> None:
         """Set conversation summary and optionally trim history."""
         session = await self.get_session(session_id)
@@ -86,23 +116,26 @@ class ConversationStore:
         # Keep only the most recent turns after summarizing
         if len(session.turns) > settings.MAX_CONVERSATION_TURNS:
             session.turns = session.turns[-10:]
-        await self._persist(session)
+            await cache.list_replace(
+                "sessions", f"{session_id}:turns",
+                [t.to_row() for t in session.turns], ttl=SESSION_TTL,
+            )
+        await self._persist_meta(session)
 
     async def clear_session(self, session_id: str) -> None:
         """Clear a session."""
         self._sessions.pop(session_id, None)
-        await cache.delete("sessions", session_id)
+        await cache.delete("sessions", f"{session_id}:meta")
+        await cache.delete("sessions", f"{session_id}:turns")
 
-    async def _persist(self, session: ConversationSession) -> None:
-        """Persist session to Redis."""
+    async def _persist_meta(self, session: ConversationSession) -> None:
+        """Persist session summary and timestamps to Redis."""
         data = {
-            "session_id": session.session_id,
-            "turns": [asdict(t) for t in session.turns],
             "summary": session.summary,
             "created_at": session.created_at,
             "updated_at": session.updated_at,
         }
-        await cache.set("sessions", session.session_id, data, ttl=86400)  # 24h TTL
+        await cache.set("sessions", f"{session.session_id}:meta", data, ttl=SESSION_TTL)
 
 
 conversation_store = ConversationStore()
@@ -15,29 +15,17 @@ class MemoryRetriever:
         Get memory context for the current session.
         Returns summary of past conversation if available.
         """
+        # Recent turns are not repeated here: build_messages already sends
+        # them as chat history, and quoting them in the system prompt would
+        # change it every turn and defeat the LLM's prompt-prefix cache
         summary = await conversation_store.get_summary(session_id)
-        history = await conversation_store.get_history(session_id)
-
-        context_parts = []
-
-        if summary:
-            context_parts.append(f"Previous conversation summary:\n{summary}")
-
-        if history:
-            # Format recent turns for context
-            recent_turns = history[-6:]  # last 3 exchanges
-            formatted = []
-            for turn in recent_turns:
-                role_label = "User" if turn["role"] == "user" else "Assistant"
-                formatted.append(f"{role_label}: {turn['content']}")
-            if formatted:
-                context_parts.append("Recent exchanges:\n" + "\n".join(formatted))
-
-        return "\n\n".join(context_parts)
+        if not summary:
+            return ""
+        return f"Previous conversation summary:\n{summary}"
 
     async def maybe_summarize(self, session_id: str) -> None:
         """Summarize conversation history if it's getting long."""
-        history = await conversation_store.get_history(session_id)
+        _, history = await conversation_store.get_session_bundle(session_id)
 
         if len(history) < settings.MEMORY_SUMMARY_THRESHOLD:
             return
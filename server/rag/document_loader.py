@@ -20,25 +20,22 @@ class DocumentLoader:
 
         for file_path in path.rglob("*"):
             if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                doc = self.load_file(str(file_path))
-                if doc:
-                    yield doc
+                yield from self.load_file(str(file_path))
 
-    def load_file(self, file_path: str) -> dict | None:
-        """Load a single file."""
+    def load_file(self, file_path: str) -> Iterator[dict]:
+        """Yield documents from a single file (one per page for PDFs)."""
         path = Path(file_path)
         ext = path.suffix.lower()
 
         try:
             if ext in (".txt", ".md"):
-                return self._load_text(path)
+                yield self._load_text(path)
             elif ext == ".pdf":
-                return self._load_pdf(path)
+                yield from self._load_pdf(path)
             elif ext == ".json":
-                return self._load_json(path)
+                yield self._load_json(path)
         except Exception as e:
             logger.error(f"Failed to load {file_path}: {e}")
-        return None
 
     def load_text(self, text: str, source: str = "inline") -> dict:
         """Load from raw text string."""
@@ -58,28 +55,38 @@ class DocumentLoader:
             },
         }
 
-    def _load_pdf(self, path: Path) -> dict:
+    def _load_pdf(self, path: Path) -> Iterator[dict]:
+        """Yield one document per non-empty page, extracting lazily."""
+        try:
+            import fitz  # pymupdf: C-backed, much faster than pypdf
+            with fitz.open(str(path)) as pdf:
+                for page in pdf:
+                    yield from self._pdf_page(path, page.get_text(), page.number + 1, pdf.page_count)
+            return
+        except ImportError:
+            pass
+
         try:
             import pypdf
             reader = pypdf.PdfReader(str(path))
-            pages = []
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    pages.append(text)
-            content = "\n\n".join(pages)
-            return {
-                "content": content.strip(),
+            for number, page in enumerate(reader.pages, 1):
+                yield from self._pdf_page(path, page.extract_text(), number, len(reader.pages))
+        except ImportError:
+            logger.warning("pymupdf not installed. Install with: pip install pymupdf")
+
+    @staticmethod
+    def _pdf_page(path: Path, text: str, page: int, pages: int) -> Iterator[dict]:
+        if text and text.strip():
+            yield {
+                "content": text.strip(),
                 "metadata": {
                     "source": path.name,
                     "path": str(path),
                     "type": "pdf",
-                    "pages": len(reader.pages),
+                    "page": page,
+                    "pages": pages,
                 },
             }
-        except ImportError:
-            logger.warning("pypdf not installed. Install with: pip install pypdf")
-            return None
 
     def _load_json(self, path: Path) -> dict:
         import json
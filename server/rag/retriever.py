@@ -1,18 +1,40 @@
 import logging
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Optional
 
+import numpy as np
+
 from server.rag.vector_store import vector_store
 from server.embeddings.embedding_client import embedding_client
 from server.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+MIN_RELEVANCE_SCORE = 0.3
+# Recent query embeddings kept in-process, ahead of the Redis embedding cache
+QUERY_CACHE_SIZE = 256
+
 
 class Retriever:
     """Retrieves relevant documents for a query using FAISS similarity search."""
 
     def __init__(self, top_k: int = None):
         self.top_k = top_k or settings.RETRIEVAL_TOP_K
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    async def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query, serving repeats from a small LRU."""
+        vector = self._query_cache.get(query)
+        if vector is not None:
+            self._query_cache.move_to_end(query)
+            return vector
+
+        vector = await embedding_client.embed(query)
+        self._query_cache[query] = vector
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return vector
 
     async def retrieve(self, query: str, top_k: int = None) -> list[dict]:
         """
@@ -24,20 +46,13 @@ class Retriever:
             return []
 
         try:
-            query_embedding = await embedding_client.embed(query)
-            results = vector_store.search(query_embedding, top_k or self.top_k)
-
-            # Filter low-relevance results
-            filtered = [r for r in results if r.get("score", 0) > 0.3]
-
-            return [
-                {
-                    "content": r.get("content", ""),
-                    "source": r.get("metadata", {}).get("source", "unknown"),
-                    "score": r.get("score", 0),
-                }
-                for r in filtered
-            ]
+            query_embedding = await self._embed_query(query)
+            # Low-relevance hits are filtered inside the vector store
+            return vector_store.search(
+                query_embedding,
+                top_k or self.top_k,
+                min_score=MIN_RELEVANCE_SCORE,
+            )
         except Exception as e:
             logger.error(f"Retrieval error: {e}")
             return []
@@ -48,11 +63,10 @@ class Retriever:
         if not docs:
             return ""
 
-        parts = []
-        for doc in docs:
-            parts.append(f"[{doc['source']}]\n{doc['content']}")
-
-        return "\n\n---\n\n".join(parts)
+        # Order by chunk id, not score: the same retrieved set then yields a
+        # byte-identical prompt prefix that the LLM server can reuse.
+        docs = sorted(docs, key=itemgetter("id"))
+        return "\n\n---\n\n".join(f"[{doc['source']}]\n{doc['content']}" for doc in docs)
 
 
 # Singleton
@@ -1,7 +1,10 @@
 import os
 import json
+import asyncio
 import logging
 import pickle
+import threading
+import msgpack
 import numpy as np
 from pathlib import Path
 from typing import Optional
@@ -20,6 +23,10 @@ class VectorStore:
         self._index = None
         self._documents: list[dict] = []  # parallel list of metadata+content
         self._dim: Optional[int] = None
+        self._dirty = False  # unsaved changes, flushed by autosave/shutdown
+        # Held while mutating or writing out the index, so autosave can run
+        # in a worker thread while searches continue on the event loop
+        self._lock = threading.Lock()
 
     def _ensure_faiss(self):
         try:
@@ -35,44 +42,84 @@ class VectorStore:
         self._dim = dim or settings.EMBEDDING_DIM
 
         index_file = self.index_path / "index.faiss"
-        docs_file = self.index_path / "documents.pkl"
+        docs_file = self.index_path / "documents.msgpack"
+        legacy_docs_file = self.index_path / "documents.pkl"
 
-        if index_file.exists() and docs_file.exists():
+        if index_file.exists() and (docs_file.exists() or legacy_docs_file.exists()):
             logger.info("Loading existing FAISS index")
             self._index = faiss.read_index(str(index_file))
-            with open(docs_file, "rb") as f:
-                self._documents = pickle.load(f)
+            if docs_file.exists():
+                self._documents = msgpack.unpackb(docs_file.read_bytes(), raw=False)
+            else:
+                # One-time migration from the old pickle format
+                logger.info("Migrating documents.pkl to documents.msgpack")
+                with open(legacy_docs_file, "rb") as f:
+                    self._documents = pickle.load(f)
+                docs_file.write_bytes(msgpack.packb(self._documents, use_bin_type=True))
             logger.info(f"Loaded {len(self._documents)} documents")
         else:
-            logger.info(f"Creating new FAISS index (dim={self._dim})")
-            self._index = faiss.IndexFlatIP(self._dim)  # Inner product (cosine with normalized vectors)
+            logger.info(f"Creating new FAISS index (dim={self._dim}, type={settings.RAG_INDEX_TYPE})")
+            self._index = self._create_index(faiss, self._dim)
+
+    def _create_index(self, faiss, dim: int):
+        """Build an empty index; inner product == cosine on normalized vectors."""
+        if settings.RAG_INDEX_TYPE == "hnsw":
+            # Graph index: sub-linear search for large corpora
+            index = faiss.IndexHNSWFlat(dim, settings.RAG_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            return index
+        if settings.RAG_INDEX_TYPE == "sq8":
+            # int8 scalar quantization: 4x less memory/bandwidth per scan.
+            # Normalized embeddings lie in [-1, 1], so the per-dimension range
+            # is fixed up front instead of learned from a (possibly tiny) first batch.
+            index = faiss.IndexScalarQuantizer(
+                dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            index.sq.rangestat = faiss.ScalarQuantizer.RS_minmax
+            bounds = np.stack([-np.ones(dim), np.ones(dim)]).astype(np.float32)
+            index.train(bounds)
+            return index
+        return faiss.IndexFlatIP(dim)
 
     def add(self, embeddings: list[np.ndarray], documents: list[dict]) -> None:
         """Add embeddings and their associated documents."""
         if self._index is None:
             self.initialize(len(embeddings[0]))
 
-        vectors = np.array(embeddings, dtype=np.float32)
-        # Normalize for cosine similarity
-        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-        vectors = vectors / (norms + 1e-10)
-
-        self._index.add(vectors)
-        self._documents.extend(documents)
-        self.save()
+        faiss = self._ensure_faiss()
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        # Normalize for cosine similarity (in place, single pass)
+        faiss.normalize_L2(vectors)
+
+        with self._lock:
+            self._index.add(vectors)
+            self._documents.extend(documents)
+            self._dirty = True
         logger.info(f"Added {len(documents)} documents to index (total: {len(self._documents)})")
 
-    def search(self, query_embedding: np.ndarray, top_k: int = None) -> list[dict]:
-        """Search for similar documents."""
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = None,
+        min_score: float = None,
+    ) -> list[dict]:
+        """
+        Search for similar documents.
+        Returns list of {"id", "content", "source", "score"} dicts; hits
+        scoring at or below `min_score` are dropped.
+        """
         if self._index is None or self._index.ntotal == 0:
             return []
 
         top_k = top_k or settings.RETRIEVAL_TOP_K
 
+        faiss = self._ensure_faiss()
+        # np.array copies, so normalizing in place leaves the caller's vector intact
         query = np.array([query_embedding], dtype=np.float32)
-        norm = np.linalg.norm(query)
-        if norm > 0:
-            query = query / norm
+        faiss.normalize_L2(query)
+
+        if hasattr(self._index, "hnsw"):
+            self._index.hnsw.efSearch = max(64, top_k * 4)
 
         distances, indices = self._index.search(query, min(top_k, self._index.ntotal))
 
@@ -80,24 +127,56 @@ class VectorStore:
         for score, idx in zip(distances[0], indices[0]):
             if idx < 0 or idx >= len(self._documents):
                 continue
-            doc = self._documents[idx].copy()
-            doc["score"] = float(score)
-            results.append(doc)
+            if min_score is not None and score <= min_score:
+                continue
+            doc = self._documents[idx]
+            results.append({
+                "id": int(idx),
+                "content": doc.get("content", ""),
+                "source": doc.get("metadata", {}).get("source", "unknown"),
+                "score": float(score),
+            })
 
         return results
 
     def save(self) -> None:
-        """Persist index and documents to disk."""
+        """Persist index and documents to disk (blocking; thread-safe)."""
         faiss = self._ensure_faiss()
-        faiss.write_index(self._index, str(self.index_path / "index.faiss"))
-        with open(self.index_path / "documents.pkl", "wb") as f:
-            pickle.dump(self._documents, f)
+        index_file = self.index_path / "index.faiss"
+        docs_file = self.index_path / "documents.msgpack"
+        index_tmp = index_file.with_suffix(".faiss.tmp")
+        docs_tmp = docs_file.with_suffix(".msgpack.tmp")
+
+        with self._lock:
+            # Write both files in full, then rename, so a crash mid-save or
+            # another worker loading the index never sees a half-written file
+            faiss.write_index(self._index, str(index_tmp))
+            docs_tmp.write_bytes(msgpack.packb(self._documents, use_bin_type=True))
+            os.replace(index_tmp, index_file)
+            os.replace(docs_tmp, docs_file)
+            self._dirty = False
+
+    def flush(self) -> None:
+        """Persist to disk only if there are unsaved changes."""
+        if self._dirty and self._index is not None:
+            self.save()
+
+    async def autosave(self, interval: float) -> None:
+        """Background task: flush pending changes every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Serializing a large index takes a while; keep it off the event loop
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"Vector store autosave failed: {e}")
 
     def clear(self) -> None:
         """Clear the index."""
         faiss = self._ensure_faiss()
-        self._index = faiss.IndexFlatIP(self._dim or settings.EMBEDDING_DIM)
-        self._documents = []
+        with self._lock:
+            self._index = self._create_index(faiss, self._dim or settings.EMBEDDING_DIM)
+            self._documents = []
         self.save()
 
     @property
@@ -1,4 +1,4 @@
-import io
+import math
 import struct
 import numpy as np
 import logging
@@ -6,64 +6,156 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# 44-byte canonical PCM WAV header (RIFF + fmt + data chunk headers)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Largest up/down factor handed to the polyphase resampler
+MAX_POLYPHASE_FACTOR = 1000
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
+
+if njit is not None:
+    # Fused single-pass kernels for the per-frame audio path
+
+    @njit(cache=True, fastmath=True)
+    def _rms_kernel(x):
+        if x.size == 0:
+            return 0.0
+        s = 0.0
+        for i in range(x.size):
+            s += x[i] * x[i]
+        return math.sqrt(s / x.size)
+
+    @njit(cache=True, fastmath=True)
+    def _pcm16_to_float32_kernel(x, out):
+        for i in range(x.size):
+            out[i] = x[i] * (1.0 / 32768.0)
+
+    @njit(cache=True, fastmath=True)
+    def _float32_to_pcm16_kernel(x, out):
+        for i in range(x.size):
+            v = min(max(x[i], -1.0), 1.0)
+            out[i] = np.int16(v * 32767.0)
+
+    @njit(cache=True, fastmath=True)
+    def _resample_linear_kernel(x, out):
+        # Same sample positions as np.linspace(0, len(x) - 1, len(out))
+        n_in = x.size
+        n_out = out.size
+        step = (n_in - 1) / (n_out - 1) if n_out > 1 else 0.0
+        for i in range(n_out):
+            pos = i * step
+            idx = int(pos)
+            if idx >= n_in - 1:
+                out[i] = x[n_in - 1]
+            else:
+                out[i] = x[idx] + (x[idx + 1] - x[idx]) * (pos - idx)
+
+    # Compile (or load from cache) at import, not on the first audio frame
+    _warm = np.zeros(4, dtype=np.float32)
+    _rms_kernel(_warm)
+    _pcm16_to_float32_kernel(np.zeros(4, dtype=np.int16), _warm)
+    # np.frombuffer over immutable bytes is read-only: a separate numba type
+    _pcm16_to_float32_kernel(np.frombuffer(bytes(8), dtype=np.int16), _warm)
+    _float32_to_pcm16_kernel(_warm, np.empty(4, dtype=np.int16))
+    _resample_linear_kernel(_warm, np.empty(2, dtype=np.float32))
+
 
 class AudioProcessor:
     """Utility class for audio format conversions and processing."""
 
     @staticmethod
-    def pcm16_to_float32(data: bytes) -> np.ndarray:
-        """Convert raw PCM int16 bytes to float32 numpy array."""
-        arr = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-        arr /= 32768.0
-        return arr
+    def pcm16_to_float32(data: bytes, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert raw PCM int16 bytes to float32 numpy array.
+        Writes into `out` (float32, one slot per sample) when given.
+        """
+        src = np.frombuffer(data, dtype=np.int16)
+        if out is None:
+            out = np.empty(src.size, dtype=np.float32)
+        if njit is not None:
+            _pcm16_to_float32_kernel(src, out)
+        else:
+            # Widen and scale in one ufunc pass straight into the output
+            np.multiply(src, np.float32(1.0 / 32768.0), out=out, casting="unsafe")
+        return out
 
     @staticmethod
     def float32_to_pcm16(data: np.ndarray) -> bytes:
         """Convert float32 numpy array to PCM int16 bytes."""
-        clipped = np.clip(data, -1.0, 1.0)
-        int16 = (clipped * 32767).astype(np.int16)
-        return int16.tobytes()
+        if njit is not None:
+            out = np.empty(len(data), dtype=np.int16)
+            _float32_to_pcm16_kernel(np.ascontiguousarray(data, dtype=np.float32), out)
+            return out.tobytes()
+        scaled = np.clip(data, -1.0, 1.0)  # new array; the caller's data is untouched
+        scaled *= 32767
+        return scaled.astype(np.int16).tobytes()
 
     @staticmethod
     def pcm16_to_wav(pcm_data: bytes, sample_rate: int = 16000, channels: int = 1) -> bytes:
         """Wrap raw PCM16 in a WAV container."""
-        buf = io.BytesIO()
         bits_per_sample = 16
         byte_rate = sample_rate * channels * bits_per_sample // 8
         block_align = channels * bits_per_sample // 8
         data_size = len(pcm_data)
 
-        buf.write(b"RIFF")
-        buf.write(struct.pack("<I", 36 + data_size))
-        buf.write(b"WAVE")
-        buf.write(b"fmt ")
-        buf.write(struct.pack("<I", 16))
-        buf.write(struct.pack("<H", 1))  # PCM
-        buf.write(struct.pack("<H", channels))
-        buf.write(struct.pack("<I", sample_rate))
-        buf.write(struct.pack("<I", byte_rate))
-        buf.write(struct.pack("<H", block_align))
-        buf.write(struct.pack("<H", bits_per_sample))
-        buf.write(b"data")
-        buf.write(struct.pack("<I", data_size))
-        buf.write(pcm_data)
-
-        return buf.getvalue()
+        header = _WAV_HEADER.pack(
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1,  # PCM
+            channels, sample_rate, byte_rate, block_align, bits_per_sample,
+            b"data", data_size,
+        )
+        return header + pcm_data
 
     @staticmethod
     def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Linear resampling."""
+        """
+        Polyphase FIR resampling (anti-aliased) for integer rate ratios,
+        linear interpolation otherwise.
+        """
         if orig_sr == target_sr:
             return audio
-        ratio = target_sr / orig_sr
-        target_len = int(len(audio) * ratio)
+
+        g = math.gcd(orig_sr, target_sr)
+        up, down = target_sr // g, orig_sr // g
+        if max(up, down) <= MAX_POLYPHASE_FACTOR:
+            try:
+                from scipy.signal import resample_poly
+                return resample_poly(audio, up, down).astype(np.float32, copy=False)
+            except ImportError:
+                pass
+
+        return AudioProcessor.resample_linear(audio, orig_sr, target_sr)
+
+    @staticmethod
+    def resample_linear(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+        """Linear-interpolation resampling (no anti-aliasing, cheapest)."""
+        if orig_sr == target_sr:
+            return audio
+
+        target_len = int(len(audio) * (target_sr / orig_sr))
+        if njit is not None and len(audio) > 0:
+            out = np.empty(target_len, dtype=np.float32)
+            _resample_linear_kernel(np.ascontiguousarray(audio, dtype=np.float32), out)
+            return out
         indices = np.linspace(0, len(audio) - 1, target_len)
         return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
 
+    @staticmethod
+    def rms(audio: np.ndarray) -> float:
+        """Root-mean-square level of an audio chunk."""
+        if njit is not None:
+            return float(_rms_kernel(np.ascontiguousarray(audio, dtype=np.float32)))
+        return float(np.sqrt(np.mean(audio ** 2))) if len(audio) else 0.0
+
     @staticmethod
     def normalize(audio: np.ndarray, target_db: float = -20.0) -> np.ndarray:
         """Normalize audio to target dBFS."""
-        rms = np.sqrt(np.mean(audio ** 2))
+        rms = AudioProcessor.rms(audio)
         if rms < 1e-10:
             return audio
         target_rms = 10 ** (target_db / 20.0)
@@ -72,8 +164,7 @@ class AudioProcessor:
     @staticmethod
     def is_silent(audio: np.ndarray, threshold: float = 0.01) -> bool:
         """Check if audio chunk is silent."""
-        rms = np.sqrt(np.mean(audio ** 2))
-        return rms < threshold
+        return AudioProcessor.rms(audio) < threshold
 
     @staticmethod
     def split_chunks(data: bytes, chunk_size: int = 32000) -> list[bytes]:
@@ -0,0 +1,99 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+@dataclass(slots=True)
+class Word:
+    word: str
+    start: float
+    end: float
+
+
+@dataclass(slots=True)
+class Segment:
+    start: float
+    end: float
+    text: str
+    words: Optional[list[Word]] = field(default=None)
+
+
+@dataclass(slots=True)
+class TranscriptionInfo:
+    language: str
+    language_probability: float
+
+
+class OnnxWhisperModel:
+    """
+    Whisper on ONNX Runtime (via optimum), exposing the subset of
+    faster-whisper's `WhisperModel.transcribe()` that SpeechToText uses.
+
+    `model_path` should point at an exported (ideally int8-quantized) model, e.g.:
+        optimum-cli export onnx --model openai/whisper-base.en whisper-onnx/
+        optimum-cli onnxruntime quantize --onnx_model whisper-onnx/ --avx512_vnni -o whisper-onnx-int8/
+    """
+
+    def __init__(self, model_path: str, device: str = "cpu"):
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+
+        provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+        processor = AutoProcessor.from_pretrained(model_path)
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(model_path, provider=provider)
+        # English-only checkpoints reject a language argument
+        self._multilingual = getattr(model.generation_config, "is_multilingual", False)
+        self._pipe = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+        )
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **_,  # faster-whisper-only options (VAD, prompts) are not supported
+    ) -> tuple[Iterator[Segment], TranscriptionInfo]:
+        generate_kwargs = {}
+        if language and self._multilingual:
+            generate_kwargs["language"] = language
+
+        result = self._pipe(
+            {"raw": audio, "sampling_rate": WHISPER_SAMPLE_RATE},
+            return_timestamps="word" if word_timestamps else True,
+            generate_kwargs=generate_kwargs,
+        )
+        chunks = result.get("chunks") or []
+
+        if word_timestamps:
+            words = [self._word(c) for c in chunks]
+            segments = [Segment(
+                start=words[0].start if words else 0.0,
+                end=words[-1].end if words else 0.0,
+                text=result["text"],
+                words=words,
+            )]
+        else:
+            segments = [
+                Segment(start=w.start, end=w.end, text=w.word)
+                for w in map(self._word, chunks)
+            ]
+
+        info = TranscriptionInfo(language=language or "en", language_probability=1.0)
+        return iter(segments), info
+
+    @staticmethod
+    def _word(chunk: dict) -> Word:
+        start, end = chunk["timestamp"]
+        start = start or 0.0
+        return Word(word=chunk["text"], start=start, end=end if end is not None else start)
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from typing import Optional
+
+from server.speech.stt import stt
+from server.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcription of a PCM int16 16kHz stream.
+
+    Audio is re-transcribed every STT_STREAM_INTERVAL_SECONDS of new input.
+    Words on which two consecutive hypotheses agree are committed
+    (LocalAgreement-2) and their audio is dropped from the working buffer,
+    so at end of utterance only a short uncommitted tail is left to decode.
+    The working buffer is capped at STT_STREAM_MAX_WINDOW_SECONDS, and a pass
+    is skipped rather than queued while every Whisper worker is busy.
+    """
+
+    def __init__(self, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        self._buffer = bytearray()  # uncommitted audio
+        self._committed: list[str] = []
+        self._previous: list[str] = []  # words of the last hypothesis
+        self._max_window = int(settings.STT_STREAM_MAX_WINDOW_SECONDS * sample_rate) * 2
+        self._task = asyncio.create_task(self._run())
+
+    def feed(self, chunk: bytes) -> None:
+        """Queue an incoming audio chunk."""
+        self._queue.put_nowait(chunk)
+
+    async def finish(self) -> str:
+        """Signal end of utterance and return the final transcript."""
+        self._queue.put_nowait(None)
+        return await self._task
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+    async def _run(self) -> str:
+        interval_bytes = int(settings.STT_STREAM_INTERVAL_SECONDS * self.sample_rate) * 2
+        pending = 0
+
+        while (chunk := await self._queue.get()) is not None:
+            self._buffer.extend(chunk)
+            pending += len(chunk)
+            # Only decode once caught up with the queue, on the newest audio.
+            # While the workers are busy (e.g. other sessions' final decodes)
+            # the pass is skipped, not queued; the next chunk retries it.
+            if pending >= interval_bytes and self._queue.empty() and not stt.busy:
+                pending = 0
+                await self._process_iter()
+
+        # Decode whatever has not been committed yet
+        if self._buffer:
+            words = await stt.transcribe_words(self._buffer, self._prompt())
+            self._committed.extend(w["word"] for w in words)
+
+        return "".join(self._committed).strip()
+
+    async def _process_iter(self) -> None:
+        words = await stt.transcribe_words(self._buffer, self._prompt())
+
+        # LocalAgreement-2: commit the common prefix of the last two hypotheses
+        agreed = 0
+        for prev, word in zip(self._previous, words):
+            if prev.strip().lower() != word["word"].strip().lower():
+                break
+            agreed += 1
+
+        # Hypotheses that keep disagreeing (noise, music) would grow the
+        # re-decoded window without bound: past the cap, force-commit all
+        # but the last, possibly truncated, word
+        if len(self._buffer) > self._max_window and agreed < len(words) - 1:
+            agreed = len(words) - 1
+
+        if agreed:
+            self._committed.extend(w["word"] for w in words[:agreed])
+            cut = int(words[agreed - 1]["end"] * self.sample_rate) * 2
+            del self._buffer[:cut]
+            logger.debug(f"Committed {agreed} words, {len(self._buffer)} bytes pending")
+
+        self._previous = [w["word"] for w in words[agreed:]]
+
+        if len(self._buffer) > self._max_window:
+            # Nothing recognisable to commit: drop the oldest audio instead
+            del self._buffer[:len(self._buffer) - self._max_window]
+
+    def _prompt(self) -> Optional[str]:
+        # Condition decoding on recently committed text for continuity
+        if not self._committed:
+            return None
+        return "".join(self._committed[-50:]).strip()
@@ -1,20 +1,46 @@
 import io
+import os
+import asyncio
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 import soundfile as sf
 
 from server.config.settings import settings
+from server.speech.audio_processor import AudioProcessor
 
 logger = logging.getLogger(__name__)
 
+# Whisper's native input rate
+WHISPER_SAMPLE_RATE = 16000
+# Spare float32 buffers kept per power-of-two size
+BUFFER_POOL_DEPTH = 4
+
 
 class SpeechToText:
     def __init__(self):
         self._model = None
+        # One inference thread per CTranslate2 worker; C++ decoding releases the GIL.
+        # Requests queue in the executor and start as soon as any worker is free.
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.WHISPER_NUM_WORKERS, thread_name_prefix="whisper"
+        )
+        self._inflight = 0  # inference calls submitted and not yet finished
+        # Reusable float32 input buffers keyed by capacity. Only touched from
+        # the event loop, so no lock is needed.
+        self._buf_pool: dict[int, list[np.ndarray]] = {}
 
     def load(self) -> None:
         """Lazy-load Whisper model."""
+        if settings.STT_BACKEND == "onnxruntime":
+            self._load_onnx()
+            return
+
+        if settings.WHISPER_NUMA_NODE >= 0:
+            self._pin_numa_node(settings.WHISPER_NUMA_NODE)
+
         try:
             from faster_whisper import WhisperModel
             logger.info(f"Loading Whisper model: {settings.WHISPER_MODEL}")
@@ -22,57 +48,186 @@ class SpeechToText:
                 settings.WHISPER_MODEL,
                 device=settings.WHISPER_DEVICE,
                 compute_type=settings.WHISPER_COMPUTE_TYPE,
+                cpu_threads=self._cpu_threads(),
+                num_workers=settings.WHISPER_NUM_WORKERS,
             )
             logger.info("Whisper model loaded")
         except ImportError:
             logger.error("faster-whisper not installed. Run: pip install faster-whisper")
             raise
 
+    @staticmethod
+    def _pin_numa_node(node: int) -> None:
+        """Restrict this process to one NUMA node's CPUs so weights stay socket-local."""
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform; NUMA pinning skipped")
+            return
+        try:
+            cpulist = Path(f"/sys/devices/system/node/node{node}/cpulist")
+            cpus = set()
+            for part in cpulist.read_text().strip().split(","):
+                first, _, last = part.partition("-")
+                cpus.update(range(int(first), int(last or first) + 1))
+            os.sched_setaffinity(0, cpus)
+            logger.info(f"Pinned to NUMA node {node} ({len(cpus)} CPUs)")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not pin to NUMA node {node}: {e}")
+
+    @staticmethod
+    def _cpu_threads() -> int:
+        """
+        CTranslate2 threads per worker: WHISPER_CPU_THREADS, else the CPUs
+        this process may run on split across WHISPER_NUM_WORKERS.
+        """
+        if settings.WHISPER_CPU_THREADS:
+            return settings.WHISPER_CPU_THREADS
+        if hasattr(os, "sched_getaffinity"):
+            # Respects cgroup/taskset limits, unlike os.cpu_count()
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+        return max(1, cpus // max(1, settings.WHISPER_NUM_WORKERS))
+
+    def _load_onnx(self) -> None:
+        try:
+            from server.speech.onnx_whisper import OnnxWhisperModel
+            logger.info(f"Loading ONNX Whisper model: {settings.WHISPER_ONNX_MODEL}")
+            self._model = OnnxWhisperModel(settings.WHISPER_ONNX_MODEL, device=settings.WHISPER_DEVICE)
+            logger.info("ONNX Whisper model loaded")
+        except ImportError:
+            logger.error("optimum not installed. Run: pip install optimum[onnxruntime]")
+            raise
+
+    async def warmup(self) -> None:
+        """
+        Load the model and run one dummy transcription so the first real
+        request does not pay for kernel initialization and buffer allocation.
+        """
+        self._ensure_loaded()
+
+        def run() -> None:
+            segments, _ = self._model.transcribe(
+                np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32),
+                language=settings.WHISPER_LANGUAGE,
+            )
+            list(segments)
+
+        await asyncio.get_running_loop().run_in_executor(self._executor, run)
+        logger.info("Whisper model warmed up")
+
+    @property
+    def busy(self) -> bool:
+        """True while every inference worker is occupied."""
+        return self._inflight >= settings.WHISPER_NUM_WORKERS
+
+    def _submit(self, fn, *args) -> asyncio.Future:
+        """Run fn on the inference executor, counting it until it finishes."""
+        self._inflight += 1
+        future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        future.add_done_callback(self._on_inference_done)
+        return future
+
+    def _on_inference_done(self, _: asyncio.Future) -> None:
+        self._inflight -= 1
+
     def _ensure_loaded(self) -> None:
         if self._model is None:
             self.load()
 
+    def _acquire_buffer(self, n_samples: int) -> np.ndarray:
+        """Get a float32 buffer with room for n_samples (power-of-two sized)."""
+        size = 1 << max(n_samples - 1, 0).bit_length()
+        free = self._buf_pool.get(size)
+        return free.pop() if free else np.empty(size, dtype=np.float32)
+
+    def _release_buffer(self, buf: np.ndarray) -> None:
+        free = self._buf_pool.setdefault(buf.size, [])
+        if len(free) < BUFFER_POOL_DEPTH:
+            free.append(buf)
+
+    def _transcribe_sync(self, audio_array: np.ndarray, language: str) -> tuple[list, object]:
+        """Blocking inference; runs on the executor, never on the event loop."""
+        segments, info = self._model.transcribe(
+            audio_array,
+            language=language,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500),
+        )
+        # Iterating the generator is what runs the decoder
+        return list(segments), info
+
+    async def _run_on_audio(self, audio_bytes: bytes | bytearray, sample_rate: int, fn, *args):
+        """
+        Convert audio to 16kHz float32 and run fn(audio_array, *args) on the
+        inference executor. WAV input is parsed by libsndfile; PCM int16 is
+        converted into a pooled buffer. Returns None for near-silent audio,
+        which would cost a full encoder pass for no text.
+        """
+        buf = None
+        future = None
+        try:
+            if audio_bytes[:4] == b"RIFF":
+                # WAV upload: libsndfile parses the header and converts in C
+                audio_array = self._prepare_wav(audio_bytes)
+            else:
+                # Convert PCM int16 bytes → float32 in [-1, 1] (single fused pass)
+                # into a pooled buffer instead of a fresh allocation
+                n_samples = len(audio_bytes) // 2
+                buf = self._acquire_buffer(n_samples)
+                # 16kHz input (the common case) needs conversion only
+                prepare = self._prepare_16k if sample_rate == WHISPER_SAMPLE_RATE else self._prepare_resampled
+                audio_array = prepare(audio_bytes, buf[:n_samples], sample_rate)
+
+            if AudioProcessor.is_silent(audio_array, threshold=settings.STT_SILENCE_RMS):
+                logger.debug("Skipping transcription of silent audio")
+                return None
+
+            future = self._submit(fn, audio_array, *args)
+            return await future
+
+        finally:
+            # If this call was cancelled mid-inference the executor may still
+            # be reading the buffer, so it is dropped rather than reused
+            if buf is not None and (future is None or (future.done() and not future.cancelled())):
+                self._release_buffer(buf)
+
     async def transcribe(
         self,
-        audio_bytes: bytes,
+        audio_bytes: bytes | bytearray,
         sample_rate: int = 16000,
         language: Optional[str] = None,
     ) -> dict:
         """
         Transcribe audio bytes (PCM int16 mono) to text.
+        Any bytes-like buffer is read in place via np.frombuffer.
         Returns dict with 'text', 'language', 'segments'.
         """
         self._ensure_loaded()
 
         try:
-            # Convert PCM int16 bytes → float32 numpy array
-            audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-            audio_array /= 32768.0  # normalize to [-1, 1]
-
-            # Resample to 16kHz if needed (Whisper requires 16kHz)
-            if sample_rate != 16000:
-                audio_array = self._resample(audio_array, sample_rate, 16000)
-
-            # Transcribe
-            segments, info = self._model.transcribe(
-                audio_array,
-                language=language or settings.WHISPER_LANGUAGE,
-                vad_filter=True,
-                vad_parameters=dict(min_silence_duration_ms=500),
+            result = await self._run_on_audio(
+                audio_bytes, sample_rate, self._transcribe_sync,
+                language or settings.WHISPER_LANGUAGE,
             )
+            if result is None:
+                return self._empty_result()
+            segments, info = result
 
             text_parts = []
             segment_list = []
             for seg in segments:
-                text_parts.append(seg.text.strip())
+                text = seg.text.strip()
+                if text:
+                    text_parts.append(text)
                 segment_list.append({
                     "start": seg.start,
                     "end": seg.end,
-                    "text": seg.text.strip(),
+                    "text": text,
                 })
 
             return {
-                "text": " ".join(text_parts).strip(),
+                # Parts are stripped and non-empty, so the join needs no strip
+                "text": " ".join(text_parts),
                 "language": info.language,
                 "probability": info.language_probability,
                 "segments": segment_list,
@@ -80,16 +235,69 @@ class SpeechToText:
 
         except Exception as e:
             logger.error(f"Transcription error: {e}")
-            return {"text": "", "language": "en", "probability": 0.0, "segments": []}
+            return self._empty_result()
+
+    async def transcribe_words(
+        self,
+        audio_bytes: bytes | bytearray,
+        initial_prompt: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Transcribe 16kHz PCM int16 audio with word timestamps.
+        Used by the streaming transcriber; runs the model off the event loop.
+        Returns list of {"word", "start", "end"} dicts.
+        """
+        self._ensure_loaded()
+
+        def run(audio_array: np.ndarray) -> list[dict]:
+            segments, _ = self._model.transcribe(
+                audio_array,
+                language=language or settings.WHISPER_LANGUAGE,
+                initial_prompt=initial_prompt,
+                word_timestamps=True,
+                condition_on_previous_text=False,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500),
+            )
+            return [
+                {"word": w.word, "start": w.start, "end": w.end}
+                for seg in segments
+                for w in (seg.words or [])
+            ]
+
+        try:
+            return await self._run_on_audio(audio_bytes, WHISPER_SAMPLE_RATE, run) or []
+        except Exception as e:
+            logger.error(f"Word transcription error: {e}")
+            return []
+
+    @staticmethod
+    def _empty_result() -> dict:
+        return {"text": "", "language": "en", "probability": 0.0, "segments": []}
+
+    @staticmethod
+    def _prepare_16k(audio_bytes: bytes | bytearray, out: np.ndarray, sample_rate: int) -> np.ndarray:
+        """PCM int16 at 16kHz → float32 in [-1, 1], written into `out`."""
+        return AudioProcessor.pcm16_to_float32(audio_bytes, out=out)
+
+    def _prepare_resampled(self, audio_bytes: bytes | bytearray, out: np.ndarray, sample_rate: int) -> np.ndarray:
+        """PCM int16 at any rate → float32 at 16kHz (Whisper requires 16kHz)."""
+        audio = AudioProcessor.pcm16_to_float32(audio_bytes, out=out)
+        return self._resample(audio, sample_rate, WHISPER_SAMPLE_RATE)
+
+    def _prepare_wav(self, wav_bytes: bytes | bytearray) -> np.ndarray:
+        """WAV (any PCM subtype/rate) → mono float32 at 16kHz."""
+        audio, sample_rate = sf.read(io.BytesIO(wav_bytes), dtype="float32", always_2d=True)
+        audio = audio[:, 0] if audio.shape[1] == 1 else audio.mean(axis=1, dtype=np.float32)
+        return self._resample(audio, sample_rate, WHISPER_SAMPLE_RATE)
 
     def _resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Simple linear resampling."""
-        if orig_sr == target_sr:
-            return audio
-        ratio = target_sr / orig_sr
-        target_length = int(len(audio) * ratio)
-        indices = np.linspace(0, len(audio) - 1, target_length)
-        return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+        """
+        Polyphase FIR resampling (anti-aliased; Whisper is sensitive to
+        aliasing in the 4-8 kHz band), linear for impractical ratios.
+        """
+        return AudioProcessor.resample(audio, orig_sr, target_sr)
 
 
 # Singleton
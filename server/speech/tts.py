@@ -1,20 +1,101 @@
-import io
 import logging
 import asyncio
 import struct
+from collections import OrderedDict
 from typing import AsyncGenerator, Optional
 
+try:
+    import zstandard
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:  # payloads are stored uncompressed
+    zstandard = None
+
 from server.config.settings import settings
 from server.cache.redis_cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Redis payloads carry a 1-byte format prefix (see _pack), hence a new namespace
+CACHE_NAMESPACE = "tts_v2"
+CACHE_TTL = 86400  # 24 hours (TTS is expensive)
+
+_RAW = b"\x00"
+_ZSTD = b"\x01"
+
+# In-process LRU in front of Redis for hot phrases
+MEM_CACHE_MAX_ENTRIES = 512
+MEM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _cache_key(h: str) -> str:
+    """Redis key of a phrase's MP3."""
+    return f"mp3:{h}"
+
+
+def _pack(value: bytes) -> bytes:
+    """
+    Prefix a cache payload with its format, zstd-compressing when it pays off.
+    Runs in worker threads; compressors are not thread-safe, so one per call.
+    """
+    if zstandard is not None:
+        compressed = zstandard.ZstdCompressor(level=3).compress(value)
+        if len(compressed) < len(value):
+            return _ZSTD + compressed
+    return _RAW + value
+
+
+def _unpack(payload: Optional[bytes]) -> Optional[bytes]:
+    if not payload:
+        return None
+    try:
+        if payload[:1] == _ZSTD:
+            return _zstd_decompressor.decompress(payload[1:]) if zstandard is not None else None
+        return payload[1:]
+    except Exception as e:
+        logger.warning(f"Corrupt TTS cache entry: {e}")
+        return None
+
+
+def _pack_items(items: list[tuple[str, bytes]]) -> list[tuple[str, bytes]]:
+    return [(key, _pack(value)) for key, value in items]
+
 
 class TextToSpeech:
     """Text-to-Speech using edge-tts (free, no API key needed)."""
 
     def __init__(self):
         self._voice = settings.TTS_VOICE
+        self._mem_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._mem_cache_bytes = 0
+        # Single-flight: one synthesis per hash, concurrent callers share it
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Fire-and-forget Redis writes (held so they are not garbage collected)
+        self._background: set[asyncio.Task] = set()
+
+    def _phrase_hash(self, text: str) -> str:
+        """Cache hash of (voice, text); xxh3 via cache.hash_key, no SHA on this path."""
+        return cache.hash_key(f"{self._voice}:{text}")
+
+    def _mem_get(self, key: str) -> Optional[bytes]:
+        value = self._mem_cache.get(key)
+        if value is not None:
+            self._mem_cache.move_to_end(key)
+        return value
+
+    def _mem_put(self, key: str, value: bytes) -> None:
+        if not value or len(value) > MEM_CACHE_MAX_BYTES:
+            return
+        old = self._mem_cache.pop(key, None)
+        if old is not None:
+            self._mem_cache_bytes -= len(old)
+        self._mem_cache[key] = value
+        self._mem_cache_bytes += len(value)
+        while (
+            len(self._mem_cache) > MEM_CACHE_MAX_ENTRIES
+            or self._mem_cache_bytes > MEM_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._mem_cache.popitem(last=False)
+            self._mem_cache_bytes -= len(evicted)
 
     async def synthesize(self, text: str) -> bytes:
         """
@@ -26,33 +107,51 @@ class TextToSpeech:
             return b""
 
         # Check cache
-        cache_key = cache.hash_key(f"{self._voice}:{text}")
-        cached = await cache.get_bytes("tts", cache_key)
+        h = self._phrase_hash(text)
+        mp3_key = _cache_key(h)
+        cached = self._mem_get(mp3_key)
+        if cached:
+            return cached
+        cached = _unpack(await cache.get_bytes(CACHE_NAMESPACE, mp3_key))
         if cached:
             logger.debug("TTS cache hit")
+            self._mem_put(mp3_key, cached)
             return cached
 
-        try:
-            import edge_tts
-
-            communicate = edge_tts.Communicate(
-                text=text,
-                voice=self._voice,
-                rate=settings.TTS_RATE,
-                volume=settings.TTS_VOLUME,
-                pitch=settings.TTS_PITCH,
-            )
-
-            audio_buffer = io.BytesIO()
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    audio_buffer.write(chunk["data"])
+        return await self._synthesize_and_cache(text, h)
 
-            audio_bytes = audio_buffer.getvalue()
+    async def _synthesize_and_cache(self, text: str, h: str) -> bytes:
+        """Synthesize once per hash; identical concurrent requests await the same result."""
+        while (pending := self._inflight.get(h)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this caller was cancelled
+                # The leading request was cancelled; take over below
 
-            # Cache for 24 hours (TTS is expensive)
-            await cache.set_bytes("tts", cache_key, audio_bytes, ttl=86400)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[h] = future
+        try:
+            result = await self._run_synthesis(text, h)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[h]
+
+    async def _run_synthesis(self, text: str, h: str) -> bytes:
+        """Run edge-tts to completion, then cache the MP3."""
+        try:
+            audio_buffer = bytearray()
+            async for chunk in self._stream(text):
+                audio_buffer += chunk
 
+            audio_bytes = bytes(audio_buffer)
+            self._store(h, audio_bytes)
             return audio_bytes
 
         except ImportError:
@@ -62,22 +161,69 @@ class TextToSpeech:
             logger.error(f"TTS error: {e}")
             return b""
 
+    async def _stream(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Yield MP3 chunks from edge-tts as they arrive."""
+        import edge_tts
+
+        communicate = edge_tts.Communicate(
+            text=text,
+            voice=self._voice,
+            rate=settings.TTS_RATE,
+            volume=settings.TTS_VOLUME,
+            pitch=settings.TTS_PITCH,
+        )
+
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+    def _store(self, h: str, mp3: bytes) -> None:
+        """
+        Cache a finished synthesis: fill the in-process LRU and write the
+        MP3 to Redis in the background.
+        """
+        if not mp3:
+            return
+
+        mp3_key = _cache_key(h)
+        self._mem_put(mp3_key, mp3)
+        self._write_back([(mp3_key, mp3)])
+
+    def _write_back(self, items: list[tuple[str, bytes]]) -> None:
+        """Write cache entries to Redis in one pipeline, off the caller's path."""
+        task = asyncio.create_task(self._write_items(items))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @staticmethod
+    async def _write_items(items: list[tuple[str, bytes]]) -> None:
+        # Compression is CPU-bound, so it runs off the event loop
+        packed = await asyncio.to_thread(_pack_items, items)
+        await cache.mset_ex(CACHE_NAMESPACE, packed, ttl=CACHE_TTL)
+
     async def synthesize_streaming(self, text: str) -> AsyncGenerator[bytes, None]:
-        """Stream audio chunks as they are generated."""
+        """
+        Stream audio chunks as they are generated.
+        Cached phrases are yielded whole; fresh ones are cached once complete.
+        """
+        if not text.strip():
+            return
+
+        h = self._phrase_hash(text)
+        mp3_key = _cache_key(h)
+        cached = self._mem_get(mp3_key) or _unpack(await cache.get_bytes(CACHE_NAMESPACE, mp3_key))
+        if cached:
+            self._mem_put(mp3_key, cached)
+            yield cached
+            return
+
         try:
-            import edge_tts
+            audio_buffer = bytearray()
+            async for chunk in self._stream(text):
+                audio_buffer += chunk
+                yield chunk
 
-            communicate = edge_tts.Communicate(
-                text=text,
-                voice=self._voice,
-                rate=settings.TTS_RATE,
-                volume=settings.TTS_VOLUME,
-                pitch=settings.TTS_PITCH,
-            )
-
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    yield chunk["data"]
+            self._store(h, bytes(audio_buffer))
 
         except Exception as e:
             logger.error(f"TTS streaming error: {e}")